@@ -5,19 +5,23 @@ Corporate Legal design palette with executive-first presentation.
 """
 
 import streamlit as st
-import json
-import html
-import time
+import re
+from collections import Counter
+from types import MappingProxyType
 from pathlib import Path
 from dotenv import load_dotenv
-import os
 
 from src.agent import run_analysis, has_api_key, load_demo_results
-from src.config import CONTRACT_DISPLAY_NAMES, CONTRACT_FILES
+from src.config import CONTRACT_DISPLAY_NAMES, CONTRACT_FILES, LLM_MODEL
 
 # Load environment variables
 load_dotenv()
 
+_APP_DIR = Path(__file__).parent
+
+# Contract selector options (CONTRACT_DISPLAY_NAMES is a static mapping)
+_CONTRACT_OPTIONS = tuple(CONTRACT_DISPLAY_NAMES.keys())
+
 # Page config - MUST BE FIRST
 st.set_page_config(
     page_title="Contract Compliance Guard",
@@ -27,58 +31,184 @@ st.set_page_config(
 )
 
 # ============================================================================
-# CONSULTING-GRADE CSS (McKinsey Style) - Loaded from external file
+# CONSULTING-GRADE CSS - Loaded from static/styles.css
 # ============================================================================
+@st.cache_resource(show_spinner=False)
 def load_css() -> str:
-    """Load CSS from external file."""
-    css_path = Path(__file__).parent / "static" / "styles.css"
-    if css_path.exists():
-        with open(css_path, "r") as f:
-            return f.read()
-    return ""
+    """Load CSS from external file (read once per process)."""
+    css_path = _APP_DIR / "static" / "styles.css"
+    try:
+        return css_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
 
-# Apply CSS
-css_content = load_css()
-st.markdown(f"""
+
+# Web fonts: preconnect + <link> instead of a render-blocking @import in the CSS
+_FONT_LINKS_HTML = """
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Merriweather:wght@400;700&family=Source+Sans+Pro:wght@400;500;600&display=swap">
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _build_page_header_html() -> str:
+    """Build the <style> block and confidentiality banner once per process.
+
+    Streamlit drops any element that is not re-emitted on a rerun, so the
+    block is still sent every run; only its construction is cached.
+    """
+    return f"""{_FONT_LINKS_HTML}
 <style>
-{css_content}
+{load_css()}
 </style>
 
 <!-- Confidentiality Banner -->
 <div class="confidential-banner">CONFIDENTIAL — CLIENT PROPRIETARY DATA</div>
-""", unsafe_allow_html=True)
+"""
+
+# Apply CSS
+st.markdown(_build_page_header_html(), unsafe_allow_html=True)
+
+
+# Single-pass HTML escaping, equivalent to html.escape(s, quote=True)
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+_HTML_SPECIAL_RE = re.compile(r'[&<>"\']')
+
+
+def _esc(s: str) -> str:
+    """Escape LLM/demo content for safe HTML interpolation.
+
+    Strings without special characters (the common case) are returned as-is.
+    """
+    if not s:
+        return ''
+    return s.translate(_HTML_ESCAPE_TABLE) if _HTML_SPECIAL_RE.search(s) else s
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_demo_results() -> MappingProxyType:
+    """Load demo results once per process and share the same read-only mapping.
+
+    The top level is wrapped in a MappingProxyType; callers must not mutate
+    the nested per-contract dicts either. To pick up edits to
+    demo_results.json without a restart, call
+    ``load_demo_results.cache_clear()``, ``_cached_demo_results.clear()``
+    and ``_summary_metrics.clear()``.
+    """
+    return MappingProxyType(load_demo_results())
+
+
+def _run_live_analysis(contract_id: str) -> dict:
+    """Run a live analysis, streaming agent output under the spinner.
+
+    Results are kept per session, keyed by (contract, model); demo
+    fallbacks are not kept, so the next click retries the live run.
+    """
+    live_results = st.session_state.setdefault('_live_results', {})
+    key = (contract_id, LLM_MODEL)
+    if key in live_results:
+        return live_results[key]
+    
+    # Show each agent's output as it streams in
+    stream_box = st.empty()
+    streamed = {}
+    
+    def on_token(node, text):
+        streamed[node] = streamed.get(node, "") + text
+        stream_box.caption(f"**{node.title()}** · …{streamed[node][-300:]}")
+    
+    result = run_analysis(contract_id, on_token=on_token)
+    if not result.get('_fallback_used'):
+        live_results[key] = result
+    return result
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _contract_preview(contract_id: str, max_chars: int = 2000) -> str:
+    """Return the truncated preview text for a sample contract."""
+    contract_path = _APP_DIR / "data" / "contracts" / CONTRACT_FILES[contract_id]
+    # Read only the preview prefix rather than the whole contract
+    with open(contract_path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read(max_chars) + "\n\n... [truncated]"
+
+
+_STATUS_PILLS = MappingProxyType({
+    'approve': '<span class="status-pill status-approve">✅ APPROVE</span>',
+    'legal_review': '<span class="status-pill status-legal-review">⚠️ LEGAL REVIEW</span>',
+    'reject': '<span class="status-pill status-reject">❌ REJECT</span>'
+})
+
+_RISK_PILLS = MappingProxyType({
+    'high': '<span class="status-pill risk-high">🔴 HIGH</span>',
+    'medium': '<span class="status-pill risk-medium">🟡 MEDIUM</span>',
+    'low': '<span class="status-pill risk-low">🟢 LOW</span>'
+})
+
+_REC_DISPLAY = MappingProxyType({
+    'approve': ('✅', 'APPROVED', 'This contract can proceed.'),
+    'legal_review': ('⚠️', 'LEGAL REVIEW REQUIRED', 'Escalate to Legal/Finance for approval.'),
+    'reject': ('❌', 'REJECT', 'This contract must be renegotiated.')
+})
+
+
+_VERDICT_CLASSES = MappingProxyType({
+    'approve': 'verdict-approve',
+    'legal_review': 'verdict-legal-review',
+    'reject': 'verdict-reject'
+})
+
+
+# Verdict score colours indexed by band: low (0-30), medium (31-60), high (61-100)
+_SCORE_COLORS = ('#1B4332', '#D4A84B', '#E74C3C')
+
+
+def _score_color(risk_score: int) -> str:
+    """Return the verdict colour for a risk score."""
+    return _SCORE_COLORS[(risk_score > 30) + (risk_score > 60)]
 
 
 def get_status_pill(recommendation: str) -> str:
     """Return styled status pill HTML based on recommendation."""
-    pills = {
-        'approve': '<span class="status-pill status-approve">✅ APPROVE</span>',
-        'legal_review': '<span class="status-pill status-legal-review">⚠️ LEGAL REVIEW</span>',
-        'reject': '<span class="status-pill status-reject">❌ REJECT</span>'
-    }
-    return pills.get(recommendation, pills['legal_review'])
+    return _STATUS_PILLS.get(recommendation, _STATUS_PILLS['legal_review'])
 
 
 def get_risk_pill(risk_level: str) -> str:
     """Return styled risk level pill."""
-    pills = {
-        'high': '<span class="status-pill risk-high">🔴 HIGH</span>',
-        'medium': '<span class="status-pill risk-medium">🟡 MEDIUM</span>',
-        'low': '<span class="status-pill risk-low">🟢 LOW</span>'
-    }
-    return pills.get(risk_level.lower(), pills['medium'])
+    return _RISK_PILLS.get(risk_level.lower(), _RISK_PILLS['medium'])
 
 
-def render_executive_summary(demo_results: dict):
-    """Render the Executive Summary Dashboard."""
-    # Calculate aggregate metrics
-    total_contracts = len(demo_results)
-    high_risk = sum(1 for r in demo_results.values() if r['resolver_verdict']['recommendation'] == 'reject')
-    medium_risk = sum(1 for r in demo_results.values() if r['resolver_verdict']['recommendation'] == 'legal_review')
-    low_risk = sum(1 for r in demo_results.values() if r['resolver_verdict']['recommendation'] == 'approve')
-    total_value = sum(r.get('total_value', 0) for r in demo_results.values())
-    
-    st.markdown(f"""
+@st.cache_data(show_spinner=False)
+def _summary_metrics(_demo_results: dict) -> tuple:
+    """Aggregate executive-summary metrics in a single pass.
+
+    The leading underscore keeps Streamlit from hashing the (process-wide,
+    read-only) demo dict, so the result is computed once per process.
+    """
+    counts = Counter()
+    total_value = 0
+    for r in _demo_results.values():
+        counts[r['resolver_verdict']['recommendation']] += 1
+        total_value += r.get('total_value', 0)
+    return len(_demo_results), counts['reject'], counts['legal_review'], counts['approve'], total_value
+
+
+@st.cache_data(show_spinner=False)
+def _build_executive_summary_html(
+    total_contracts: int,
+    high_risk: int,
+    medium_risk: int,
+    low_risk: int,
+    total_value: float,
+) -> str:
+    """Build the Executive Summary HTML (memoized on its scalar inputs)."""
+    return f"""
     <div class="executive-summary">
         <h2>⚖️ Contract Compliance Guard — Executive Summary</h2>
         <div style="display: grid; grid-template-columns: repeat(5, 1fr); gap: 1.5rem;">
@@ -109,104 +239,105 @@ def render_executive_summary(demo_results: dict):
             <span class="after">Agent Analysis: 60 sec</span>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
 
-def render_advocate_panel(arguments: list):
-    """Render the Advocate's arguments panel."""
-    st.markdown("""
-    <div class="debate-panel advocate-panel">
-        <div class="debate-header">
-            <span class="emoji">🟢</span>
-            <h3>Advocate Agent</h3>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("*\"This contract is acceptable because...\"*")
+def render_executive_summary(demo_results: dict):
+    """Render the Executive Summary Dashboard."""
+    st.markdown(
+        _build_executive_summary_html(*_summary_metrics(demo_results)),
+        unsafe_allow_html=True,
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _build_advocate_html(arguments: list) -> str:
+    """Build the Advocate panel HTML (memoized on the argument list)."""
+    parts = [
+        '<div class="debate-panel advocate-panel">',
+        '<div class="debate-header"><span class="emoji">🟢</span><h3>Advocate Agent</h3></div>',
+        '<p><em>"This contract is acceptable because..."</em></p>',
+    ]
     
     for arg in arguments:
         strength = arg.get('strength', 'moderate')
         strength_class = f"strength-{strength}"
         
         # Escape LLM/demo content for security
-        point_escaped = html.escape(arg.get('point', ''))
-        argument_escaped = html.escape(arg.get('argument', ''))
-        strength_escaped = html.escape(strength)
+        point_escaped = _esc(arg.get('point', ''))
+        argument_escaped = _esc(arg.get('argument', ''))
+        strength_escaped = _esc(strength)
         
-        st.markdown(f"""
-        <div class="argument-card">
-            <strong>{point_escaped}</strong>
-            <span class="strength-badge {strength_class}">{strength_escaped}</span>
-            <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: #2D2A26;">
-                {argument_escaped}
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        parts.append(
+            f'<div class="argument-card">'
+            f'<strong>{point_escaped}</strong> '
+            f'<span class="strength-badge {strength_class}">{strength_escaped}</span>'
+            f'<p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: #2D2A26;">{argument_escaped}</p>'
+            f'</div>'
+        )
     
-    st.markdown("</div>", unsafe_allow_html=True)
+    parts.append('</div>')
+    return "\n".join(parts)
 
 
-def render_auditor_panel(findings: list):
-    """Render the Auditor's findings panel."""
-    st.markdown("""
-    <div class="debate-panel auditor-panel">
-        <div class="debate-header">
-            <span class="emoji">🔴</span>
-            <h3>Auditor Agent</h3>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("*\"I found these risk factors...\"*")
+def render_advocate_panel(arguments: list):
+    """Render the Advocate's arguments panel."""
+    st.markdown(_build_advocate_html(arguments), unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _build_auditor_html(findings: list) -> str:
+    """Build the Auditor panel HTML (memoized on the findings list)."""
+    parts = [
+        '<div class="debate-panel auditor-panel">',
+        '<div class="debate-header"><span class="emoji">🔴</span><h3>Auditor Agent</h3></div>',
+        '<p><em>"I found these risk factors..."</em></p>',
+    ]
     
     for finding in findings:
         risk = finding.get('risk_level', 'medium').lower()
         
         # Escape LLM/demo content for security
-        clause_escaped = html.escape(finding.get('clause', ''))
-        finding_escaped = html.escape(finding.get('finding', ''))
+        clause_escaped = _esc(finding.get('clause', ''))
+        finding_escaped = _esc(finding.get('finding', ''))
         
-        st.markdown(f"""
-        <div class="finding-card {risk}">
-            <strong>{clause_escaped}</strong>
-            {get_risk_pill(risk)}
-            <p style="margin: 0.5rem 0; font-size: 0.9rem; color: #2D2A26;">
-                {finding_escaped}
-            </p>
-        """, unsafe_allow_html=True)
+        parts.append(
+            f'<div class="finding-card {risk}">'
+            f'<strong>{clause_escaped}</strong> {get_risk_pill(risk)}'
+            f'<p style="margin: 0.5rem 0; font-size: 0.9rem; color: #2D2A26;">{finding_escaped}</p>'
+        )
         
         if finding.get('asc_606_reference'):
-            asc_ref_escaped = html.escape(finding['asc_606_reference'])
-            st.markdown(f'<span class="asc-reference">{asc_ref_escaped}</span>', unsafe_allow_html=True)
+            asc_ref_escaped = _esc(finding['asc_606_reference'])
+            parts.append(f'<span class="asc-reference">{asc_ref_escaped}</span>')
         
         if finding.get('exact_quote'):
-            quote_escaped = html.escape(finding['exact_quote'][:150])
-            st.markdown(f'<div class="contract-quote">"{quote_escaped}..."</div>', unsafe_allow_html=True)
+            quote_escaped = _esc(finding['exact_quote'][:150])
+            parts.append(f'<div class="contract-quote">"{quote_escaped}..."</div>')
         
         if finding.get('suggested_revision'):
-            revision_escaped = html.escape(finding['suggested_revision'])
-            st.markdown(f'<p style="font-size: 0.8rem; color: #1B4332; margin: 0.5rem 0 0 0;"><strong>💡 Suggested:</strong> {revision_escaped}</p>', unsafe_allow_html=True)
+            revision_escaped = _esc(finding['suggested_revision'])
+            parts.append(f'<p style="font-size: 0.8rem; color: #1B4332; margin: 0.5rem 0 0 0;"><strong>💡 Suggested:</strong> {revision_escaped}</p>')
         
-        st.markdown("</div>", unsafe_allow_html=True)
+        parts.append('</div>')
     
-    st.markdown("</div>", unsafe_allow_html=True)
+    parts.append('</div>')
+    return "\n".join(parts)
 
 
-def render_verdict(verdict: dict, contract_name: str):
-    """Render the Resolver's verdict."""
-    recommendation = verdict['recommendation']
-    risk_score = verdict['risk_score']
-    confidence = verdict['confidence']
-    
-    verdict_class = f"verdict-{recommendation.replace('_', '-')}"
+def render_auditor_panel(findings: list):
+    """Render the Auditor's findings panel."""
+    st.markdown(_build_auditor_html(findings), unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False)
+def _build_verdict_html(recommendation: str, risk_score: int, confidence: int) -> str:
+    """Build the verdict box HTML (memoized on its scalar inputs)."""
+    verdict_class = _VERDICT_CLASSES.get(recommendation, 'verdict-legal-review')
     
-    rec_display = {
-        'approve': ('✅', 'APPROVED', 'This contract can proceed.'),
-        'legal_review': ('⚠️', 'LEGAL REVIEW REQUIRED', 'Escalate to Legal/Finance for approval.'),
-        'reject': ('❌', 'REJECT', 'This contract must be renegotiated.')
-    }
-    emoji, label, action = rec_display.get(recommendation, rec_display['legal_review'])
+    emoji, label, action = _REC_DISPLAY.get(recommendation, _REC_DISPLAY['legal_review'])
     
-    st.markdown(f"""
+    return f"""
     <div class="verdict-box {verdict_class}">
         <div style="display: flex; justify-content: space-between; align-items: center;">
             <div>
@@ -214,7 +345,7 @@ def render_verdict(verdict: dict, contract_name: str):
                 <p style="margin: 0.5rem 0 0 0; color: #5C5752;">{action}</p>
             </div>
             <div style="text-align: right;">
-                <div style="font-size: 2.5rem; font-weight: 700; font-family: 'Merriweather', Georgia, serif; color: {'#E74C3C' if risk_score > 60 else '#D4A84B' if risk_score > 30 else '#1B4332'};">
+                <div style="font-size: 2.5rem; font-weight: 700; font-family: 'Merriweather', Georgia, serif; color: {_score_color(risk_score)};">
                     {risk_score}
                 </div>
                 <div style="font-size: 0.8rem; color: #5C5752; text-transform: uppercase; letter-spacing: 0.05em;">Risk Score</div>
@@ -222,67 +353,97 @@ def render_verdict(verdict: dict, contract_name: str):
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Reasoning - escape LLM/demo content
-    st.markdown("### 🎯 Resolver Reasoning")
-    reasoning_escaped = html.escape(verdict.get('reasoning', ''))
-    st.markdown(f"> {reasoning_escaped}")
+    """
+
+
+def render_verdict(verdict: dict, contract_name: str):
+    """Render the Resolver's verdict."""
+    st.markdown(
+        _build_verdict_html(verdict['recommendation'], verdict['risk_score'], verdict['confidence']),
+        unsafe_allow_html=True,
+    )
     
-    # Key factors - escape LLM/demo content
-    st.markdown("### 🔑 Key Factors")
-    for factor in verdict.get('key_factors', []):
-        factor_escaped = html.escape(factor)
-        st.markdown(f"• {factor_escaped}")
+    # Reasoning and key factors - escape LLM/demo content
+    reasoning_escaped = _esc(verdict.get('reasoning', ''))
+    parts = ["### 🎯 Resolver Reasoning", f"> {reasoning_escaped}", "### 🔑 Key Factors"]
+    parts.extend(f"• {_esc(factor)}" for factor in verdict.get('key_factors', []))
+    st.markdown("\n\n".join(parts))
+
+
+_STEP_OK_RE = re.compile(r'✓|APPROVE')
+_STEP_ALERT_RE = re.compile(r'[⚠🔴]|REJECT')
+
+
+def _status_class(summary: str) -> str:
+    """Classify a trace step summary for styling."""
+    if _STEP_OK_RE.search(summary):
+        return "step-ok"
+    if _STEP_ALERT_RE.search(summary):
+        return "step-alert"
+    return "step-info"
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _build_trace_html(trace: list) -> str:
+    """Build the investigation trace HTML (memoized on the trace list)."""
+    # Escape demo/LLM content
+    return "\n".join(
+        f'<div class="investigation-step">• <strong>Step {step["step"]}:</strong> '
+        f'{_esc(step.get("tool", ""))} '
+        f'<span class="{_status_class(step.get("summary", ""))}">[{_esc(step.get("summary", ""))}]</span>'
+        f'</div>'
+        for step in trace
+    )
 
 
 def render_investigation_trace(trace: list):
-    """Render the agent investigation trace."""
-    st.markdown("### 🔍 Analysis Trace")
-    
-    with st.chat_message("assistant", avatar="⚖️"):
-        for step in trace:
-            summary = step.get('summary', '')
-            
-            if '✓' in summary or 'APPROVE' in summary:
-                status_class = "step-ok"
-            elif '⚠' in summary or '🔴' in summary or 'REJECT' in summary:
-                status_class = "step-alert"
-            else:
-                status_class = "step-info"
-            
-            # Escape demo/LLM content
-            tool_escaped = html.escape(step.get('tool', ''))
-            summary_escaped = html.escape(summary)
-            
-            st.markdown(f"""
-            <div class="investigation-step">
-                • <strong>Step {step['step']}:</strong> {tool_escaped}
-                <span class="{status_class}">[{summary_escaped}]</span>
-            </div>
-            """, unsafe_allow_html=True)
+    """Render the agent investigation trace inside its expander."""
+    with st.expander("📋 View Analysis Trace", expanded=False):
+        st.markdown("### 🔍 Analysis Trace")
+        
+        with st.chat_message("assistant", avatar="⚖️"):
+            st.markdown(_build_trace_html(trace), unsafe_allow_html=True)
+
+
+# Static sidebar blocks, pre-rendered so each emits as a single element
+_SIDEBAR_HEADER_HTML = """
+<div style="text-align: center; padding: 1rem 0 1.5rem 0;">
+    <div style="font-size: 2.5rem;">⚖️</div>
+    <h2 style="margin: 0.5rem 0 0 0; font-size: 1.3rem;">Contract Compliance Guard</h2>
+</div>
+<div class="methodology-badge">
+    <strong>Methodology:</strong><br>
+    Adversarial AI Agents + ASC 606 Compliance v1.0
+</div>
+<hr>
+"""
+
+_SIDEBAR_LEGEND_HTML = """
+<hr>
+<h3>📊 Risk Legend</h3>
+<ul>
+    <li>🟢 <strong>Low (0-30)</strong>: Approve</li>
+    <li>🟡 <strong>Medium (31-60)</strong>: Legal Review</li>
+    <li>🔴 <strong>High (61-100)</strong>: Reject</li>
+</ul>
+<hr>
+<h3>🧪 Test Scenarios</h3>
+<ul>
+    <li><strong>Standard SaaS</strong>: 🟢 Low risk</li>
+    <li><strong>Extended Payment</strong>: 🟡 Net 120 terms</li>
+    <li><strong>Right of Return</strong>: 🔴 90-day returns</li>
+    <li><strong>Price Protection</strong>: 🔴 MFC clause</li>
+    <li><strong>Consignment</strong>: 🔴 No control transfer</li>
+</ul>
+<hr>
+"""
 
 
 def render_sidebar(demo_results: dict, api_available: bool):
     """Render the polished sidebar."""
     with st.sidebar:
-        # Logo/Title
-        st.markdown("""
-        <div style="text-align: center; padding: 1rem 0 1.5rem 0;">
-            <div style="font-size: 2.5rem;">⚖️</div>
-            <h2 style="margin: 0.5rem 0 0 0; font-size: 1.3rem;">Contract Compliance Guard</h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Methodology badge
-        st.markdown("""
-        <div class="methodology-badge">
-            <strong>Methodology:</strong><br>
-            Adversarial AI Agents + ASC 606 Compliance v1.0
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.divider()
+        # Logo/Title and methodology badge
+        st.markdown(_SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
         
         # Mode indicator
         if st.session_state.get('demo_mode', True):
@@ -299,10 +460,9 @@ def render_sidebar(demo_results: dict, api_available: bool):
         # Contract selector
         st.markdown("### 📄 Select Contract")
         
-        contract_options = list(CONTRACT_DISPLAY_NAMES.keys())
         selected_contract = st.selectbox(
             "Choose a contract:",
-            options=contract_options,
+            options=_CONTRACT_OPTIONS,
             format_func=lambda x: CONTRACT_DISPLAY_NAMES.get(x, x)
         )
         
@@ -313,29 +473,8 @@ def render_sidebar(demo_results: dict, api_available: bool):
             rec = result['resolver_verdict']['recommendation']
             st.markdown(get_status_pill(rec), unsafe_allow_html=True)
         
-        st.divider()
-        
-        # Legend
-        st.markdown("### 📊 Risk Legend")
-        st.markdown("""
-        - 🟢 **Low (0-30)**: Approve
-        - 🟡 **Medium (31-60)**: Legal Review
-        - 🔴 **High (61-100)**: Reject
-        """)
-        
-        st.divider()
-        
-        # Test scenarios
-        st.markdown("### 🧪 Test Scenarios")
-        st.markdown("""
-        - **Standard SaaS**: 🟢 Low risk
-        - **Extended Payment**: 🟡 Net 120 terms
-        - **Right of Return**: 🔴 90-day returns
-        - **Price Protection**: 🔴 MFC clause
-        - **Consignment**: 🔴 No control transfer
-        """)
-        
-        st.divider()
+        # Legend and test scenarios
+        st.markdown(_SIDEBAR_LEGEND_HTML, unsafe_allow_html=True)
         
         # Action buttons
         col1, col2 = st.columns(2)
@@ -356,12 +495,14 @@ def main():
     if 'last_contract' not in st.session_state:
         st.session_state['last_contract'] = None
     
-    # Check API availability
-    api_available = has_api_key()
+    # Check API availability (once per session)
+    if '_api_available' not in st.session_state:
+        st.session_state['_api_available'] = has_api_key()
+    api_available = st.session_state['_api_available']
     
     # Load demo results
     try:
-        demo_results = load_demo_results()
+        demo_results = _cached_demo_results()
     except Exception as e:
         st.error(f"Unable to load demo data: {e}")
         st.stop()
@@ -370,11 +511,13 @@ def main():
     if not api_available and not st.session_state['demo_mode']:
         st.session_state['demo_mode'] = True
     
+    demo_mode = st.session_state['demo_mode']
+    
     # Render sidebar
     selected_contract, analyze_btn, clear_btn = render_sidebar(demo_results, api_available)
     
     # Demo mode banner
-    if st.session_state.get('demo_mode', True):
+    if demo_mode:
         st.markdown("""
         <div class="demo-banner">
             🎭 <strong>Demo Mode</strong> — Using pre-recorded adversarial agent analyses
@@ -409,12 +552,15 @@ def main():
             if 'analysis_result' in st.session_state:
                 del st.session_state['analysis_result']
             
-            spinner_text = "🎭 Loading demo analysis..." if st.session_state.get('demo_mode', True) else "⚖️ Running adversarial analysis..."
+            spinner_text = "🎭 Loading demo analysis..." if demo_mode else "⚖️ Running adversarial analysis..."
             
             with st.spinner(spinner_text):
                 try:
-                    time.sleep(0.8)  # Simulate processing
-                    result = run_analysis(selected_contract, use_demo=st.session_state.get('demo_mode', True))
+                    if demo_mode:
+                        # Demo results are already memoized by load_demo_results()
+                        result = run_analysis(selected_contract, use_demo=True)
+                    else:
+                        result = _run_live_analysis(selected_contract)
                     st.session_state['analysis_result'] = result
                 except Exception as e:
                     st.error(f"Analysis failed: {e}")
@@ -457,8 +603,7 @@ def main():
             render_verdict(result['resolver_verdict'], contract_name)
             
             # Investigation trace in expander
-            with st.expander("📋 View Analysis Trace", expanded=False):
-                render_investigation_trace(result.get('trace', []))
+            render_investigation_trace(result.get('trace', []))
         
         else:
             # Placeholder
@@ -467,10 +612,7 @@ def main():
             # Show contract preview
             with st.expander("📄 Contract Preview", expanded=True):
                 try:
-                    contract_path = Path(__file__).parent / "data" / "contracts" / CONTRACT_FILES[selected_contract]
-                    with open(contract_path, "r") as f:
-                        contract_text = f.read()
-                    st.code(contract_text[:2000] + "\n\n... [truncated]", language="text")
+                    st.code(_contract_preview(selected_contract), language="text")
                 except Exception:
                     st.warning("Contract preview not available")
 
@@ -9,9 +9,28 @@ This module implements the adversarial agent architecture:
 
 import os
 import json
+import asyncio
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, List, Optional
+
+from .tools import (
+    load_contract,
+    extract_contract_terms,
+    check_payment_terms,
+    check_return_rights,
+    check_variable_consideration,
+    calculate_risk_score,
+)
+from .prompts import (
+    ADVOCATE_SYSTEM_PROMPT,
+    AUDITOR_SYSTEM_PROMPT,
+    RESOLVER_SYSTEM_PROMPT,
+    ADVOCATE_USER_TEMPLATE,
+    AUDITOR_USER_TEMPLATE,
+    RESOLVER_USER_TEMPLATE,
+)
 
 try:
     from dotenv import load_dotenv
@@ -27,8 +46,13 @@ def has_api_key() -> bool:
     return bool(os.getenv("ANTHROPIC_API_KEY"))
 
 
+@lru_cache(maxsize=1)
 def load_demo_results() -> Dict[str, Any]:
-    """Load pre-recorded demo results."""
+    """Load pre-recorded demo results (parsed once per process).
+    
+    The returned dict is shared between callers and must not be mutated;
+    use ``load_demo_results.cache_clear()`` to force a reload.
+    """
     demo_path = Path(__file__).parent.parent / "data" / "demo_results.json"
     with open(demo_path, "r") as f:
         return json.load(f)
@@ -44,264 +68,444 @@ def run_demo_analysis(contract_id: str) -> Dict[str, Any]:
     return demo_results[contract_id]
 
 
-def run_live_analysis(contract_id: str) -> Dict[str, Any]:
-    """Run live analysis using AI agents.
+# Contract text sent to the Advocate (short) and Auditor (long)
+EXCERPT_SHORT_CHARS = 3000
+EXCERPT_LONG_CHARS = 4000
+
+
+def extract_terms_update(contract_text: str) -> Dict[str, Any]:
+    """Extract contract terms and precompute the prompt inputs derived from them.
     
-    This would use LangGraph and Claude to actually analyze the contract.
-    For now, falls back to demo mode if not implemented.
+    The terms JSON is serialized once (with sorted keys, so it is
+    byte-identical across agents and runs) and shared by every prompt.
     """
-    # Check for API key
-    if not has_api_key():
-        raise RuntimeError("ANTHROPIC_API_KEY not set")
+    terms = extract_contract_terms(contract_text)
+    return {
+        "extracted_terms": terms,
+        "extracted_terms_json": json.dumps(terms, indent=2, sort_keys=True),
+        "contract_excerpt_short": contract_text[:EXCERPT_SHORT_CHARS],
+        "contract_excerpt_long": contract_text[:EXCERPT_LONG_CHARS],
+    }
+
+
+def _system_message(prompt: str) -> Dict[str, Any]:
+    """Build a system message marked as a prompt-caching breakpoint.
+    
+    Anthropic reuses the cached prefix for identical system prompts within
+    its cache window. Prompts shorter than the model's minimum cacheable
+    length are simply sent uncached.
+    """
+    return {
+        "role": "system",
+        "content": [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}],
+    }
+
+
+def build_advocate_messages(state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Build the Advocate agent's chat messages for a contract state."""
+    return [
+        _system_message(ADVOCATE_SYSTEM_PROMPT),
+        {"role": "user", "content": ADVOCATE_USER_TEMPLATE.format_map(state)},
+    ]
+
+
+def build_auditor_messages(state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Build the Auditor agent's chat messages for a contract state."""
+    return [
+        _system_message(AUDITOR_SYSTEM_PROMPT),
+        {"role": "user", "content": AUDITOR_USER_TEMPLATE.format_map(state)},
+    ]
+
+
+def build_resolver_messages(state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Build the Resolver agent's chat messages for a contract state."""
+    return [
+        _system_message(RESOLVER_SYSTEM_PROMPT),
+        {"role": "user", "content": RESOLVER_USER_TEMPLATE.format(
+            advocate_arguments_json=json.dumps(state["advocate_arguments"], indent=2),
+            auditor_findings_json=json.dumps(state["auditor_findings"], indent=2),
+            extracted_terms_json=state["extracted_terms_json"],
+        )},
+    ]
+
+
+def _loads_json(content: str, open_char: str, close_char: str) -> Any:
+    """Parse JSON from a model response that may wrap it in fences or prose.
     
+    Tries the response as-is first, then the outermost open_char...close_char
+    span (which also strips ```json fences). Raises json.JSONDecodeError when
+    neither parses.
+    """
     try:
-        # Attempt to import and use LangGraph
-        from langchain_anthropic import ChatAnthropic
-        from langgraph.graph import StateGraph, END
-        
-        from .tools import (
-            load_contract,
-            extract_contract_terms,
-            check_payment_terms,
-            check_return_rights,
-            check_variable_consideration,
-            calculate_risk_score,
-        )
-        from .prompts import (
-            EXTRACTOR_SYSTEM_PROMPT,
-            ADVOCATE_SYSTEM_PROMPT,
-            AUDITOR_SYSTEM_PROMPT,
-            RESOLVER_SYSTEM_PROMPT,
+        return json.loads(content)
+    except json.JSONDecodeError:
+        start = content.find(open_char)
+        end = content.rfind(close_char)
+        if start == -1 or end <= start:
+            raise
+        return json.loads(content[start:end + 1])
+
+
+_RESOLVER_REQUIRED_KEYS = ("recommendation", "risk_score", "confidence")
+
+
+def _is_list_of_dicts(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+
+def parse_advocate_response(content: str) -> List[Dict[str, Any]]:
+    """Parse Advocate output, wrapping non-JSON or misshapen text as a single argument."""
+    try:
+        arguments = _loads_json(content, "[", "]")
+    except json.JSONDecodeError:
+        arguments = None
+    if not _is_list_of_dicts(arguments):
+        return [{"point": "Analysis", "argument": content, "strength": "moderate"}]
+    return arguments
+
+
+def parse_auditor_response(content: str) -> List[Dict[str, Any]]:
+    """Parse Auditor output, wrapping non-JSON or misshapen text as a single finding."""
+    try:
+        findings = _loads_json(content, "[", "]")
+    except json.JSONDecodeError:
+        findings = None
+    if not _is_list_of_dicts(findings):
+        return [{"clause": "Analysis", "risk_level": "medium", "finding": content}]
+    return findings
+
+
+def parse_resolver_response(content: str, state: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse Resolver output, falling back to a score computed from the policy checks."""
+    try:
+        verdict = _loads_json(content, "{", "}")
+    except json.JSONDecodeError:
+        verdict = None
+    if not (isinstance(verdict, dict) and all(key in verdict for key in _RESOLVER_REQUIRED_KEYS)):
+        # Fallback - calculate from checks
+        risk_score = calculate_risk_score(
+            state.get("_payment_check") or {},
+            state.get("_return_check") or {},
+            state.get("_variable_check") or {},
         )
-        from .state import ContractAnalysisState
-        
-        # Initialize Claude
-        llm = ChatAnthropic(model="claude-sonnet-4-20250514", temperature=0)
-        
-        # Load contract
-        contract_text = load_contract(contract_id)
-        
-        # Define the graph
-        def extraction_node(state: ContractAnalysisState) -> ContractAnalysisState:
-            """Extract terms from contract."""
-            terms = extract_contract_terms(state["contract_text"])
-            state["extracted_terms"] = terms
-            state["trace"].append({
-                "step": 1,
-                "tool": "extract_contract_terms",
-                "summary": f"Extracted key terms from contract"
-            })
-            return state
-        
-        def policy_check_node(state: ContractAnalysisState) -> ContractAnalysisState:
-            """Run policy checks."""
-            terms = state["extracted_terms"]
-            
-            payment_check = check_payment_terms(terms)
-            state["trace"].append({
+        verdict = {
+            "risk_score": risk_score,
+            "confidence": 70,
+            "recommendation": "legal_review" if risk_score > 30 else "approve",
+            "reasoning": content,
+            "key_factors": ["See detailed analysis"]
+        }
+    return verdict
+
+
+def run_policy_checks(terms: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the deterministic policy checks and return their state update."""
+    payment_check = check_payment_terms(terms)
+    return_check = check_return_rights(terms)
+    variable_check = check_variable_consideration(terms)
+    
+    # Serialized once for the Auditor prompt
+    policy_checks_json = "\n".join([
+        f"- Payment: {json.dumps(payment_check, sort_keys=True)}",
+        f"- Returns: {json.dumps(return_check, sort_keys=True)}",
+        f"- Variable Consideration: {json.dumps(variable_check, sort_keys=True)}",
+    ])
+    
+    return {
+        "_payment_check": payment_check,
+        "_return_check": return_check,
+        "_variable_check": variable_check,
+        "_policy_checks_json": policy_checks_json,
+        "_all_compliant": payment_check["compliant"] and return_check["compliant"] and variable_check["compliant"],
+        "trace": [
+            {
                 "step": 2,
                 "tool": "check_payment_terms",
                 "summary": "✓ Compliant" if payment_check["compliant"] else "⚠ Issues found"
-            })
-            
-            return_check = check_return_rights(terms)
-            state["trace"].append({
+            },
+            {
                 "step": 3,
-                "tool": "check_return_rights", 
+                "tool": "check_return_rights",
                 "summary": "✓ Compliant" if return_check["compliant"] else "⚠ Issues found"
-            })
-            
-            variable_check = check_variable_consideration(terms)
-            state["trace"].append({
+            },
+            {
                 "step": 4,
                 "tool": "check_variable_consideration",
                 "summary": "✓ Compliant" if variable_check["compliant"] else "⚠ Issues found"
-            })
-            
-            state["_payment_check"] = payment_check
-            state["_return_check"] = return_check
-            state["_variable_check"] = variable_check
-            
-            return state
-        
-        def advocate_node(state: ContractAnalysisState) -> ContractAnalysisState:
-            """Generate Advocate arguments."""
-            # Use LLM to generate advocate arguments
-            messages = [
-                {"role": "system", "content": ADVOCATE_SYSTEM_PROMPT},
-                {"role": "user", "content": f"""
-Analyze this contract and provide your best arguments for why it should be approved:
-
-Contract Terms:
-{json.dumps(state["extracted_terms"], indent=2)}
-
-Contract Text (relevant sections):
-{state["contract_text"][:3000]}
-
-Provide 3-5 strong arguments in favor of accepting this contract.
-Format as JSON array with: point, argument, strength (strong/moderate/weak)
-"""}
-            ]
-            
-            response = llm.invoke(messages)
-            
-            # Parse response (simplified - real implementation would be more robust)
-            try:
-                arguments = json.loads(response.content)
-            except json.JSONDecodeError:
-                arguments = [{"point": "Analysis", "argument": response.content, "strength": "moderate"}]
-            
-            state["advocate_arguments"] = arguments
-            state["trace"].append({
+            },
+        ],
+    }
+
+
+def _chunk_text(chunk) -> str:
+    """Extract the text of a streamed message chunk."""
+    if isinstance(chunk.content, str):
+        return chunk.content
+    # Anthropic chunks may arrive as a list of content blocks
+    return "".join(block.get("text", "") for block in chunk.content if isinstance(block, dict))
+
+
+async def _stream_graph(
+    graph,
+    initial_state: Dict[str, Any],
+    config: Dict[str, Any],
+    on_token: Callable[[str, str], None],
+) -> Dict[str, Any]:
+    """Run the graph, forwarding LLM tokens to on_token(node, text) as they arrive."""
+    final_state = None
+    async for event in graph.astream_events(initial_state, config=config, version="v2"):
+        kind = event["event"]
+        if kind == "on_chat_model_stream":
+            text = _chunk_text(event["data"]["chunk"])
+            if text:
+                on_token(event["metadata"].get("langgraph_node", ""), text)
+        elif kind == "on_chain_end" and not event["parent_ids"]:
+            # The root run ending carries the final graph state
+            final_state = event["data"]["output"]
+    return final_state
+
+
+def _make_llm(rate_limiter=None):
+    """Create a Claude client.
+    
+    Not cached: the client's async HTTP pool is bound to the event loop it
+    first runs on, and every run_analysis() call starts a new loop.
+    """
+    from langchain_anthropic import ChatAnthropic
+    from .config import LLM_MODEL, LLM_TEMPERATURE
+    
+    if rate_limiter is None:
+        return ChatAnthropic(model=LLM_MODEL, temperature=LLM_TEMPERATURE)
+    return ChatAnthropic(model=LLM_MODEL, temperature=LLM_TEMPERATURE, rate_limiter=rate_limiter)
+
+
+def _make_batch_llm(max_concurrency: int):
+    """Create a rate-limited Claude client shared by one batch_analyze() run.
+    
+    The bucket holds enough tokens for every in-flight advocate/auditor
+    request, so the limiter only throttles sustained load, not the fan-out
+    at the start of each analysis.
+    """
+    from .config import LLM_MAX_REQUESTS_PER_MINUTE
+    
+    try:
+        from langchain_core.rate_limiters import InMemoryRateLimiter
+    except ImportError:
+        # Older langchain-core: rely on the client's retry-on-429 instead
+        return _make_llm()
+    
+    rate_limiter = InMemoryRateLimiter(
+        requests_per_second=LLM_MAX_REQUESTS_PER_MINUTE / 60,
+        max_bucket_size=2 * max_concurrency,
+    )
+    return _make_llm(rate_limiter)
+
+
+@lru_cache(maxsize=1)
+def _get_compiled_graph():
+    """Build and compile the analysis graph once per process.
+    
+    LangGraph/LangChain are imported here rather than at module level so
+    demo mode never pays their import cost; raises ImportError when they
+    are not installed. The LLM nodes read their client from
+    config["configurable"]["llm"], so the compiled graph holds no
+    loop-bound state.
+    """
+    from langgraph.graph import StateGraph, END
+    from langchain_core.runnables import RunnableConfig
+    
+    from .state import ContractAnalysisState
+    from .config import LLM_MODEL, LLM_TEMPERATURE, FAST_APPROVE_COMPLIANT
+    from .llm_cache import cached_ainvoke
+    
+    # Define the graph
+    def extraction_node(state: ContractAnalysisState) -> ContractAnalysisState:
+        """Extract terms from contract."""
+        return {
+            **extract_terms_update(state["contract_text"]),
+            "trace": [{
+                "step": 1,
+                "tool": "extract_contract_terms",
+                "summary": f"Extracted key terms from contract"
+            }],
+        }
+    
+    def policy_check_node(state: ContractAnalysisState) -> ContractAnalysisState:
+        """Run policy checks."""
+        return run_policy_checks(state["extracted_terms"])
+    
+    def route_after_policy_check(state: ContractAnalysisState):
+        """Skip the debate when every deterministic policy check passed."""
+        if FAST_APPROVE_COMPLIANT and state["_all_compliant"]:
+            return "fast_approve"
+        return ["advocate", "auditor"]
+    
+    def fast_approve_node(state: ContractAnalysisState) -> ContractAnalysisState:
+        """Approve a fully compliant contract without the LLM debate."""
+        risk_score = calculate_risk_score(
+            state["_payment_check"],
+            state["_return_check"],
+            state["_variable_check"],
+        )
+        return {
+            "advocate_arguments": [],
+            "auditor_findings": [],
+            "resolver_verdict": {
+                "risk_score": risk_score,
+                "confidence": 90,
+                "recommendation": "approve",
+                "reasoning": "All payment, return and variable consideration policy checks passed, so the contract was approved without an adversarial review.",
+                "key_factors": ["Payment terms within policy", "Return rights within policy", "No variable consideration concerns"],
+            },
+            "trace": [{
                 "step": 5,
-                "tool": "generate_advocate_argument",
-                "summary": f"Generated {len(arguments)} arguments"
-            })
-            
-            return state
-        
-        def auditor_node(state: ContractAnalysisState) -> ContractAnalysisState:
-            """Generate Auditor findings."""
-            messages = [
-                {"role": "system", "content": AUDITOR_SYSTEM_PROMPT},
-                {"role": "user", "content": f"""
-Analyze this contract for risky clauses and compliance issues:
-
-Contract Terms:
-{json.dumps(state["extracted_terms"], indent=2)}
-
-Policy Check Results:
-- Payment: {json.dumps(state.get("_payment_check", {}))}
-- Returns: {json.dumps(state.get("_return_check", {}))}
-- Variable Consideration: {json.dumps(state.get("_variable_check", {}))}
-
-Contract Text:
-{state["contract_text"][:4000]}
-
-Identify all risky clauses. For each finding include:
-- clause: The problematic clause
-- risk_level: high/medium/low
-- finding: Your analysis
-- asc_606_reference: ASC 606 citation if applicable
-- exact_quote: Exact text from contract
-- suggested_revision: How to fix it
-
-Format as JSON array.
-"""}
-            ]
-            
-            response = llm.invoke(messages)
-            
-            try:
-                findings = json.loads(response.content)
-            except json.JSONDecodeError:
-                findings = [{"clause": "Analysis", "risk_level": "medium", "finding": response.content}]
-            
-            state["auditor_findings"] = findings
-            state["trace"].append({
-                "step": 6,
-                "tool": "generate_auditor_findings",
-                "summary": f"Found {len(findings)} issues"
-            })
-            
-            return state
+                "tool": "fast_approve",
+                "summary": f"✓ All policy checks passed - APPROVE (score {risk_score}/100)"
+            }],
+        }
+    
+    # Advocate and auditor share a parent and both feed the resolver, so
+    # LangGraph runs them in the same super-step; async lets their LLM
+    # round-trips overlap.
+    async def advocate_node(state: ContractAnalysisState, config: RunnableConfig) -> ContractAnalysisState:
+        """Generate Advocate arguments."""
+        # Use LLM to generate advocate arguments
+        messages = build_advocate_messages(state)
         
-        def resolver_node(state: ContractAnalysisState) -> ContractAnalysisState:
-            """Resolve the debate and make final recommendation."""
-            messages = [
-                {"role": "system", "content": RESOLVER_SYSTEM_PROMPT},
-                {"role": "user", "content": f"""
-Make a final decision on this contract:
-
-ADVOCATE ARGUMENTS:
-{json.dumps(state["advocate_arguments"], indent=2)}
-
-AUDITOR FINDINGS:
-{json.dumps(state["auditor_findings"], indent=2)}
-
-CONTRACT TERMS:
-{json.dumps(state["extracted_terms"], indent=2)}
-
-Weigh both sides and provide:
-1. risk_score (0-100)
-2. confidence (0-100)
-3. recommendation (approve/legal_review/reject)
-4. reasoning (explain your decision)
-5. key_factors (list of 3-5 key factors)
-
-Format as JSON object.
-"""}
-            ]
-            
-            response = llm.invoke(messages)
-            
-            try:
-                verdict = json.loads(response.content)
-            except json.JSONDecodeError:
-                # Fallback - calculate from checks
-                risk_score = calculate_risk_score(
-                    state.get("_payment_check", {}),
-                    state.get("_return_check", {}),
-                    state.get("_variable_check", {})
-                )
-                verdict = {
-                    "risk_score": risk_score,
-                    "confidence": 70,
-                    "recommendation": "legal_review" if risk_score > 30 else "approve",
-                    "reasoning": response.content,
-                    "key_factors": ["See detailed analysis"]
-                }
-            
-            state["resolver_verdict"] = verdict
-            state["trace"].append({
-                "step": 7,
-                "tool": "resolve_debate",
-                "summary": f"Verdict: {verdict['recommendation'].upper()} (score {verdict['risk_score']}/100)"
-            })
-            
-            return state
+        content, cached = await cached_ainvoke(config["configurable"]["llm"], messages, LLM_MODEL, LLM_TEMPERATURE)
         
-        # Build graph
-        workflow = StateGraph(ContractAnalysisState)
+        arguments = parse_advocate_response(content)
         
-        workflow.add_node("extract", extraction_node)
-        workflow.add_node("policy_check", policy_check_node)
-        workflow.add_node("advocate", advocate_node)
-        workflow.add_node("auditor", auditor_node)
-        workflow.add_node("resolver", resolver_node)
+        return {
+            "advocate_arguments": arguments,
+            "trace": [{
+                "step": 5,
+                "tool": "generate_advocate_argument",
+                "summary": f"Generated {len(arguments)} arguments" + (" (cached)" if cached else "")
+            }],
+        }
+    
+    async def auditor_node(state: ContractAnalysisState, config: RunnableConfig) -> ContractAnalysisState:
+        """Generate Auditor findings."""
+        messages = build_auditor_messages(state)
         
-        workflow.set_entry_point("extract")
-        workflow.add_edge("extract", "policy_check")
-        workflow.add_edge("policy_check", "advocate")
-        workflow.add_edge("policy_check", "auditor")
-        workflow.add_edge("advocate", "resolver")
-        workflow.add_edge("auditor", "resolver")
-        workflow.add_edge("resolver", END)
+        content, cached = await cached_ainvoke(config["configurable"]["llm"], messages, LLM_MODEL, LLM_TEMPERATURE)
         
-        graph = workflow.compile()
+        findings = parse_auditor_response(content)
         
-        # Run analysis
-        initial_state = {
-            "contract_id": contract_id,
-            "contract_text": contract_text,
-            "trace": []
+        return {
+            "auditor_findings": findings,
+            "trace": [{
+                "step": 6,
+                "tool": "generate_auditor_findings",
+                "summary": f"Found {len(findings)} issues" + (" (cached)" if cached else "")
+            }],
         }
+    
+    async def resolver_node(state: ContractAnalysisState, config: RunnableConfig) -> ContractAnalysisState:
+        """Resolve the debate and make final recommendation."""
+        messages = build_resolver_messages(state)
         
-        final_state = graph.invoke(initial_state)
+        content, cached = await cached_ainvoke(config["configurable"]["llm"], messages, LLM_MODEL, LLM_TEMPERATURE)
         
-        return final_state
+        verdict = parse_resolver_response(content, state)
         
+        return {
+            "resolver_verdict": verdict,
+            "trace": [{
+                "step": 7,
+                "tool": "resolve_debate",
+                "summary": f"Verdict: {verdict['recommendation'].upper()} (score {verdict['risk_score']}/100)" + (" (cached)" if cached else "")
+            }],
+        }
+    
+    # Build graph
+    workflow = StateGraph(ContractAnalysisState)
+    
+    workflow.add_node("extract", extraction_node)
+    workflow.add_node("policy_check", policy_check_node)
+    workflow.add_node("advocate", advocate_node)
+    workflow.add_node("auditor", auditor_node)
+    workflow.add_node("resolver", resolver_node)
+    workflow.add_node("fast_approve", fast_approve_node)
+    
+    workflow.set_entry_point("extract")
+    workflow.add_edge("extract", "policy_check")
+    workflow.add_conditional_edges(
+        "policy_check",
+        route_after_policy_check,
+        ["fast_approve", "advocate", "auditor"],
+    )
+    workflow.add_edge("advocate", "resolver")
+    workflow.add_edge("auditor", "resolver")
+    workflow.add_edge("resolver", END)
+    workflow.add_edge("fast_approve", END)
+    
+    return workflow.compile()
+
+
+async def arun_live_analysis(
+    contract_id: str,
+    on_token: Optional[Callable[[str, str], None]] = None,
+    llm=None,
+) -> Dict[str, Any]:
+    """Run live analysis using AI agents.
+    
+    This would use LangGraph and Claude to actually analyze the contract.
+    For now, falls back to demo mode if not implemented.
+    
+    Args:
+        contract_id: The contract identifier
+        on_token: Optional callback receiving (node name, text) for each
+            streamed LLM token, so callers can render output during generation
+        llm: Claude client to use; defaults to a new one for the running
+            event loop
+    """
+    # Check for API key
+    if not has_api_key():
+        raise RuntimeError("ANTHROPIC_API_KEY not set")
+    
+    # Build the graph on first use (LangGraph not available -> demo)
+    try:
+        graph = _get_compiled_graph()
     except ImportError:
-        # LangGraph not available, fall back to demo
         return run_demo_analysis(contract_id)
+    
+    if llm is None:
+        llm = _make_llm()
+    config = {"configurable": {"llm": llm}}
+    
+    # Run analysis
+    initial_state = {
+        "contract_id": contract_id,
+        "contract_text": load_contract(contract_id),
+        "trace": []
+    }
+    
+    if on_token is None:
+        return await graph.ainvoke(initial_state, config=config)
+    
+    return await _stream_graph(graph, initial_state, config, on_token)
+
+
+def run_live_analysis(contract_id: str, on_token: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
+    """Synchronous wrapper around arun_live_analysis()."""
+    return asyncio.run(arun_live_analysis(contract_id, on_token=on_token))
 
 
-def run_analysis(contract_id: str, use_demo: bool = False) -> Dict[str, Any]:
+async def arun_analysis(
+    contract_id: str,
+    use_demo: bool = False,
+    on_token: Optional[Callable[[str, str], None]] = None,
+    llm=None,
+) -> Dict[str, Any]:
     """Run contract analysis, with demo mode fallback.
     
     Args:
         contract_id: The contract identifier
         use_demo: Force demo mode even if API key available
+        on_token: Optional streaming callback for live mode (see run_live_analysis)
+        llm: Optional Claude client for live mode (see arun_live_analysis)
         
     Returns:
         Analysis results including advocate/auditor arguments and verdict
@@ -310,10 +514,62 @@ def run_analysis(contract_id: str, use_demo: bool = False) -> Dict[str, Any]:
         return run_demo_analysis(contract_id)
     
     try:
-        return run_live_analysis(contract_id)
+        return await arun_live_analysis(contract_id, on_token=on_token, llm=llm)
     except Exception as e:
         # Fall back to demo on any error - log warning and flag the result
         logger.warning(f"Live analysis failed: {e}, using demo mode")
-        result = run_demo_analysis(contract_id)
-        result['_fallback_used'] = True
-        return result
+        # Copy so the flag doesn't leak into the shared demo results
+        return {**run_demo_analysis(contract_id), '_fallback_used': True}
+
+
+def run_analysis(
+    contract_id: str,
+    use_demo: bool = False,
+    on_token: Optional[Callable[[str, str], None]] = None,
+) -> Dict[str, Any]:
+    """Synchronous wrapper around arun_analysis()."""
+    return asyncio.run(arun_analysis(contract_id, use_demo=use_demo, on_token=on_token))
+
+
+async def batch_analyze(
+    contract_ids: List[str],
+    use_demo: bool = False,
+    max_concurrency: int = 10,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> List[Any]:
+    """Analyze many contracts concurrently.
+    
+    Args:
+        contract_ids: Contract identifiers to analyze
+        use_demo: Force demo mode even if API key available
+        max_concurrency: Maximum number of analyses in flight at once
+        on_progress: Optional callback receiving (completed, total)
+        
+    Returns:
+        One entry per contract id, in order: the analysis result, or the
+        exception raised for that contract
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    total = len(contract_ids)
+    
+    # One rate-limited client for the whole batch, created on this loop
+    llm = None
+    if not use_demo and has_api_key():
+        try:
+            llm = _make_batch_llm(max_concurrency)
+        except ImportError:
+            pass  # arun_analysis falls back to demo
+
+    completed = 0
+    
+    async def analyze_one(contract_id: str) -> Dict[str, Any]:
+        nonlocal completed
+        async with semaphore:
+            try:
+                return await arun_analysis(contract_id, use_demo=use_demo, llm=llm)
+            finally:
+                completed += 1
+                if on_progress:
+                    on_progress(completed, total)
+    
+    return await asyncio.gather(*(analyze_one(cid) for cid in contract_ids), return_exceptions=True)
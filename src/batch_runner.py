@@ -0,0 +1,179 @@
+"""Regenerate data/demo_results.json through the Anthropic Message Batches API.
+
+Live analysis issues one request per agent per contract. For the offline job
+of refreshing the demo data, all contracts are submitted together instead:
+one batch with every Advocate and Auditor prompt (they are independent), then
+one batch with every Resolver prompt (which needs both of their outputs).
+Batched requests are billed at a discount and avoid per-request overhead.
+
+Usage:
+    python -m src.batch_runner
+"""
+
+import json
+import time
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .agent import (
+    build_advocate_messages,
+    build_auditor_messages,
+    build_resolver_messages,
+    extract_terms_update,
+    parse_advocate_response,
+    parse_auditor_response,
+    parse_resolver_response,
+    run_policy_checks,
+)
+from .config import CONTRACT_FILES, CONTRACT_DISPLAY_NAMES, LLM_MODEL, LLM_TEMPERATURE
+from .tools import load_contract
+
+logger = logging.getLogger(__name__)
+
+DEMO_RESULTS_PATH = Path(__file__).parent.parent / "data" / "demo_results.json"
+
+MAX_TOKENS = 4096
+POLL_INTERVAL_SECONDS = 30
+
+
+def _initial_state(contract_id: str) -> Dict[str, Any]:
+    """Run the deterministic extraction and policy checks for a contract."""
+    contract_text = load_contract(contract_id)
+    extraction = extract_terms_update(contract_text)
+    checks = run_policy_checks(extraction["extracted_terms"])
+
+    state = {
+        "contract_id": contract_id,
+        "contract_text": contract_text,
+        **extraction,
+        "trace": [{
+            "step": 1,
+            "tool": "extract_contract_terms",
+            "summary": "Extracted key terms from contract"
+        }],
+    }
+    state["trace"] += checks.pop("trace")
+    state.update(checks)
+    return state
+
+
+def _batch_request(custom_id: str, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert chat messages into a Message Batches request entry."""
+    # System content blocks (with their cache_control markers) pass through as-is
+    system = [block for m in messages if m["role"] == "system" for block in m["content"]]
+    return {
+        "custom_id": custom_id,
+        "params": {
+            "model": LLM_MODEL,
+            "max_tokens": MAX_TOKENS,
+            "temperature": LLM_TEMPERATURE,
+            "system": system,
+            "messages": [m for m in messages if m["role"] != "system"],
+        },
+    }
+
+
+def _run_batch(client, requests: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Submit a batch, wait for it to finish, and return text keyed by custom_id."""
+    batch = client.messages.batches.create(requests=requests)
+    logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+
+    while batch.processing_status != "ended":
+        time.sleep(POLL_INTERVAL_SECONDS)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    results = {}
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            results[entry.custom_id] = "".join(
+                block.text for block in entry.result.message.content if block.type == "text"
+            )
+        else:
+            logger.warning(f"Batch request {entry.custom_id} {entry.result.type}")
+    return results
+
+
+def _step(step: int, tool: str, summary: str) -> Dict[str, Any]:
+    """Build a trace step."""
+    return {"step": step, "tool": tool, "summary": summary}
+
+
+def regenerate_demo_results(output_path: Path = DEMO_RESULTS_PATH) -> Dict[str, Any]:
+    """Re-analyze every sample contract via two batches and write the demo results.
+
+    Contracts whose requests fail keep their existing entry.
+    """
+    import anthropic
+
+    client = anthropic.Anthropic()
+    states = {cid: _initial_state(cid) for cid in CONTRACT_FILES}
+
+    # Batch 1: Advocate and Auditor prompts for every contract
+    debate = _run_batch(client, [
+        request
+        for cid, state in states.items()
+        for request in (
+            _batch_request(f"{cid}__advocate", build_advocate_messages(state)),
+            _batch_request(f"{cid}__auditor", build_auditor_messages(state)),
+        )
+    ])
+
+    for cid, state in list(states.items()):
+        advocate = debate.get(f"{cid}__advocate")
+        auditor = debate.get(f"{cid}__auditor")
+        if advocate is None or auditor is None:
+            del states[cid]
+            continue
+        state["advocate_arguments"] = parse_advocate_response(advocate)
+        state["auditor_findings"] = parse_auditor_response(auditor)
+        state["trace"] += [
+            _step(5, "generate_advocate_argument", f"Generated {len(state['advocate_arguments'])} arguments"),
+            _step(6, "generate_auditor_findings", f"Found {len(state['auditor_findings'])} issues"),
+        ]
+
+    demo_results = json.loads(output_path.read_text(encoding="utf-8")) if output_path.exists() else {}
+    if not states:
+        # Every debate request failed; an empty batch would be rejected
+        logger.warning("No contracts left to resolve; demo results unchanged")
+        return demo_results
+
+    # Batch 2: Resolver prompts, which depend on both sides of the debate
+    verdicts = _run_batch(client, [
+        _batch_request(f"{cid}__resolver", build_resolver_messages(state))
+        for cid, state in states.items()
+    ])
+
+    for cid, state in states.items():
+        if f"{cid}__resolver" not in verdicts:
+            continue
+        verdict = parse_resolver_response(verdicts[f"{cid}__resolver"], state)
+        terms = state["extracted_terms"]
+        demo_results[cid] = {
+            "contract_name": CONTRACT_DISPLAY_NAMES.get(cid, cid),
+            "parties": terms.get("parties", {}),
+            "effective_date": terms.get("effective_date"),
+            "term_months": terms.get("term_months", 0),
+            "total_value": terms.get("total_value", 0),
+            "extracted_terms": terms,
+            "advocate_arguments": state["advocate_arguments"],
+            "auditor_findings": state["auditor_findings"],
+            "resolver_verdict": verdict,
+            "trace": state["trace"] + [_step(
+                7,
+                "resolve_debate",
+                f"Verdict: {verdict['recommendation'].upper()} (score {verdict['risk_score']}/100)"
+            )],
+        }
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(demo_results, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+    return demo_results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    results = regenerate_demo_results()
+    print(f"Wrote {len(results)} analyses to {DEMO_RESULTS_PATH}")
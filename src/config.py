@@ -1,12 +1,14 @@
 """Configuration for Contract Compliance Guard."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
 
+@lru_cache(maxsize=1)
 def load_company_policy() -> Dict[str, Any]:
-    """Load company policy configuration.
+    """Load company policy configuration (parsed once per process).
     
     Raises:
         FileNotFoundError: If policy file doesn't exist
@@ -31,6 +33,16 @@ RETURN_PERIOD_MAX_DAYS = COMPANY_POLICY.get("return_period_max_days", 30)
 AUTO_ESCALATION_MAX_PERCENT = COMPANY_POLICY.get("auto_escalation_max_percent", 3)
 VARIABLE_CONSIDERATION_THRESHOLD = COMPANY_POLICY.get("variable_consideration_threshold_percent", 10)
 
+# Claude model used by the live agents (temperature 0 keeps responses cacheable)
+LLM_MODEL = "claude-sonnet-4-20250514"
+LLM_TEMPERATURE = 0
+# Combined request budget across concurrent analyses (see agent.batch_analyze)
+LLM_MAX_REQUESTS_PER_MINUTE = 50
+# Approve contracts that pass every policy check without running the LLM debate.
+# Off by default: the regex checks pass right_of_return, milestone_payment and
+# auto_renewal, which the full debate escalates or rejects.
+FAST_APPROVE_COMPLIANT = False
+
 # Clauses requiring legal review
 REQUIRES_LEGAL_REVIEW = COMPANY_POLICY.get("requires_legal_review", [])
 
@@ -0,0 +1,115 @@
+"""Content-addressed cache for deterministic LLM calls.
+
+Responses are keyed on a hash of (model, messages, temperature) and stored in
+a small SQLite database under data/.llm_cache/, so repeat analyses of the same
+contract skip the Anthropic round-trip even across process restarts. Only
+temperature-0 calls are cached; anything else is passed straight through.
+
+Set LLM_CACHE_ENABLED=0 to disable the cache.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = Path(__file__).parent.parent / "data" / ".llm_cache" / "responses.sqlite3"
+
+# Process-wide hit/miss counters
+CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def is_enabled() -> bool:
+    """Check whether the LLM response cache is enabled."""
+    return os.getenv("LLM_CACHE_ENABLED", "1") != "0"
+
+
+def cache_key(messages: List[Dict[str, Any]], model: str, temperature: float) -> str:
+    """Build the cache key for a request."""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH)
+    conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)")
+    return conn
+
+
+def _get(key: str) -> Optional[str]:
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT content FROM responses WHERE key = ?", (key,)).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def _put(key: str, content: Any) -> None:
+    # Structured (non-text) content is not cached
+    if not isinstance(content, str):
+        return
+    conn = _connect()
+    try:
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)", (key, content))
+    finally:
+        conn.close()
+
+
+def _content(response) -> Any:
+    """Extract the content of a response, logging Anthropic prompt-cache usage."""
+    usage = getattr(response, "response_metadata", {}).get("usage", {})
+    if usage.get("cache_read_input_tokens"):
+        logger.debug(f"Prompt cache read {usage['cache_read_input_tokens']} input tokens")
+    return response.content
+
+
+def _lookup(messages, model, temperature) -> Tuple[Optional[str], Optional[str]]:
+    """Return (key, cached content); key is None when caching does not apply."""
+    if temperature != 0 or not is_enabled():
+        return None, None
+    key = cache_key(messages, model, temperature)
+    content = _get(key)
+    if content is not None:
+        CACHE_STATS["hits"] += 1
+    else:
+        CACHE_STATS["misses"] += 1
+    return key, content
+
+
+def cached_invoke(llm, messages: List[Dict[str, Any]], model: str, temperature: float) -> Tuple[Any, bool]:
+    """Invoke the LLM, serving repeat temperature-0 requests from the cache.
+
+    Returns:
+        (response content, whether it came from the cache)
+    """
+    key, content = _lookup(messages, model, temperature)
+    if content is not None:
+        return content, True
+
+    content = _content(llm.invoke(messages))
+    if key is not None:
+        _put(key, content)
+    return content, False
+
+
+async def cached_ainvoke(llm, messages: List[Dict[str, Any]], model: str, temperature: float) -> Tuple[Any, bool]:
+    """Async variant of cached_invoke()."""
+    key, content = _lookup(messages, model, temperature)
+    if content is not None:
+        return content, True
+
+    content = _content(await llm.ainvoke(messages))
+    if key is not None:
+        _put(key, content)
+    return content, False
@@ -77,3 +77,63 @@ Your output must include:
 5. Key factors that drove your decision
 
 You are the final arbiter. Make a decisive recommendation."""
+
+# User-message templates, filled with str.format_map() from the analysis state
+
+ADVOCATE_USER_TEMPLATE = """
+Analyze this contract and provide your best arguments for why it should be approved:
+
+Contract Terms:
+{extracted_terms_json}
+
+Contract Text (relevant sections):
+{contract_excerpt_short}
+
+Provide 3-5 strong arguments in favor of accepting this contract.
+Format as JSON array with: point, argument, strength (strong/moderate/weak)
+"""
+
+AUDITOR_USER_TEMPLATE = """
+Analyze this contract for risky clauses and compliance issues:
+
+Contract Terms:
+{extracted_terms_json}
+
+Policy Check Results:
+{_policy_checks_json}
+
+Contract Text:
+{contract_excerpt_long}
+
+Identify all risky clauses. For each finding include:
+- clause: The problematic clause
+- risk_level: high/medium/low
+- finding: Your analysis
+- asc_606_reference: ASC 606 citation if applicable
+- exact_quote: Exact text from contract
+- suggested_revision: How to fix it
+
+Format as JSON array.
+"""
+
+RESOLVER_USER_TEMPLATE = """
+Make a final decision on this contract:
+
+ADVOCATE ARGUMENTS:
+{advocate_arguments_json}
+
+AUDITOR FINDINGS:
+{auditor_findings_json}
+
+CONTRACT TERMS:
+{extracted_terms_json}
+
+Weigh both sides and provide:
+1. risk_score (0-100)
+2. confidence (0-100)
+3. recommendation (approve/legal_review/reject)
+4. reasoning (explain your decision)
+5. key_factors (list of 3-5 key factors)
+
+Format as JSON object.
+"""
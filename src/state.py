@@ -1,6 +1,7 @@
 """State schema for Contract Compliance Guard multi-agent system."""
 
-from typing import TypedDict, List, Dict, Optional, Literal
+import operator
+from typing import Annotated, TypedDict, List, Dict, Optional, Literal
 from dataclasses import dataclass, field
 
 
@@ -64,6 +65,16 @@ class ContractAnalysisState(TypedDict, total=False):
     
     # Extraction results
     extracted_terms: ExtractedTerms
+    extracted_terms_json: str  # Serialized once for every agent prompt
+    contract_excerpt_short: str  # Advocate context
+    contract_excerpt_long: str  # Auditor context
+    
+    # Policy check results (internal, consumed by auditor/resolver)
+    _payment_check: Dict
+    _return_check: Dict
+    _variable_check: Dict
+    _policy_checks_json: str  # Auditor prompt rendering of the three checks
+    _all_compliant: bool  # Routes fully compliant contracts past the debate
     
     # Adversarial debate
     advocate_arguments: List[AdvocateArgument]
@@ -72,8 +83,9 @@ class ContractAnalysisState(TypedDict, total=False):
     # Resolution
     resolver_verdict: ResolverVerdict
     
-    # Metadata
-    trace: List[TraceStep]
+    # Metadata - nodes return new steps only; the reducer appends them so
+    # parallel nodes (advocate/auditor) can both contribute in one step
+    trace: Annotated[List[TraceStep], operator.add]
     error: Optional[str]
 
 
@@ -94,8 +106,20 @@ RISK_THRESHOLDS = {
 }
 
 
+# Risk level for every integer score in RISK_THRESHOLDS, indexed by score
+_RISK_LEVEL_BY_SCORE = {
+    score: level
+    for level, (low, high) in RISK_THRESHOLDS.items()
+    for score in range(low, high + 1)
+}
+
+
 def get_risk_level(score: int) -> str:
     """Get risk level label from score."""
+    level = _RISK_LEVEL_BY_SCORE.get(score)
+    if level is not None:
+        return level
+    # Non-integral scores (e.g. 45.5) keep the original range comparison
     for level, (low, high) in RISK_THRESHOLDS.items():
         if low <= score <= high:
             return level
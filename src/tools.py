@@ -1,9 +1,10 @@
 """Tools for Contract Compliance Guard analysis."""
 
 import re
-import json
+import string
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from .config import (
     PAYMENT_TERMS_MAX_DAYS,
     RETURN_PERIOD_MAX_DAYS,
@@ -13,8 +14,9 @@ from .config import (
 )
 
 
+@lru_cache(maxsize=64)
 def load_contract(contract_id: str) -> str:
-    """Load contract text from file."""
+    """Load contract text from file (read once per contract and process)."""
     from .config import CONTRACT_FILES
     
     if contract_id not in CONTRACT_FILES:
@@ -22,35 +24,130 @@ def load_contract(contract_id: str) -> str:
     
     contract_path = Path(__file__).parent.parent / "data" / "contracts" / CONTRACT_FILES[contract_id]
     
-    if not contract_path.exists():
-        raise FileNotFoundError(f"Contract file not found: {contract_path}")
-    
-    with open(contract_path, "r") as f:
-        return f.read()
+    try:
+        return contract_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Contract file not found: {contract_path}") from None
+
+
+# Term extraction patterns, compiled once at import. All but the two
+# case-sensitive party-role patterns match against the lower-cased contract,
+# so they are written in lower case and compiled without re.IGNORECASE.
+_PARTIES_END_RE = re.compile(r'\n(?:\d\.|effective)')
+_PROVIDER_RE = re.compile(r'(?:Provider|Licensor|Supplier|Consignor|Manufacturer|Developer):\s*([^"\n]+?)(?:\s*\("|\n)')
+_CUSTOMER_RE = re.compile(r'(?:Customer|Licensee|Distributor|Consignee|Buyer|Client):\s*([^"\n]+?)(?:\s*\("|\n)')
+_EFFECTIVE_DATE_RE = re.compile(r'effective date:\s*(\w+ \d+, \d{4}|\d{4}-\d{2}-\d{2})')
+_TERM_RE = re.compile(r'(?:term|initial term):\s*(\d+)\s*months')
+_NET_DAYS_RE = re.compile(r'net[\s-]?(\d+)\s*days?')
+_VALUE_RES = tuple(re.compile(p) for p in (
+    # (?!label) stops a run of labels before one colon from each rescanning
+    # up to it; the captured value only depends on the colon
+    r'total(?:(?!total)[^:])*:\s*\$?([\d,]+(?:\.\d{2})?)',
+    r'annual(?:(?!annual)[^:])*:\s*\$?([\d,]+(?:\.\d{2})?)',
+    r'license fee:\s*\$?([\d,]+(?:\.\d{2})?)',
+    r'subscription fee:\s*\$?([\d,]+(?:\.\d{2})?)',
+))
+# (?<!\d) starts numbers at their first digit instead of retrying every suffix
+_RETURN_DAYS_RE = re.compile(r'(?<!\d)(\d+)\s*days?\s*(?:of|from)\s*delivery')
+_ESCALATION_RE = re.compile(r'(?:increase|escalat\w*)\s*(?:by\s*)?(\d+(?:\.\d+)?)\s*(?:percent|%)')
+# Liability cap: within a sentence mentioning liability, the last cap phrase
+# following "not exceed". Matched by _find_liability_cap() rather than one
+# pattern, which backtracked quadratically on long sentences.
+_NOT_EXCEED_RE = re.compile(r'not\s+exceed')
+_LIABILITY_CAP_AMOUNT_RE = re.compile(r'(?=((?<!\d)\d+\s+months?\s+(?:of\s+)?fees|fees\s+paid|license\s+fee))')
+
+# Clause presence probes. Each regex only runs when one of its literal
+# keywords occurs in the text: the C substring search rules out most absent
+# clauses far faster than a regex scan, and a present clause's search stops
+# at its first match.
+_CLAUSE_PROBES = {
+    'return_rights': (('return',), re.compile(r'right\s+(?:of|to)\s+return|unconditional\s+return')),
+    'auto_renewal': (('renew',), re.compile(r'auto(?:matic(?:ally)?)?[\s-]?renew')),
+    'consignment': (('consignment', 'title'), re.compile(r'consignment|title\s+retention|retains?\s+(?:full\s+)?(?:legal\s+)?title')),
+    'mfc': (('most', 'mfc', 'price'), re.compile(r'most\s+favored\s+customer|mfc|price\s+protection|price\s+match')),
+    'milestone': (('milestone', 'contingent'), re.compile(r'milestone[\s-]?(?:based|payment)|contingent\s+(?:on|upon)')),
+    'unlimited_liability': (('unlimited',), re.compile(r'unlimited\s+liability')),
+}
+
+# ASC 606 citation per risk factor, flattened once for the policy checks
+_ASC_REF = {factor: (info or {}).get('reference') for factor, info in ASC_606_RISK_FACTORS.items()}
+
+# Risk weights used by the policy checks, bound once at import
+_W_EXTENDED_PAYMENT = RISK_WEIGHTS['extended_payment_terms']
+_W_RIGHT_OF_RETURN = RISK_WEIGHTS['right_of_return']
+_W_MFC = RISK_WEIGHTS['mfc_clause']
+_W_MILESTONE = RISK_WEIGHTS['milestone_payments']
+_W_CONSIGNMENT = RISK_WEIGHTS['consignment']
+_W_HIGH_ESCALATION = RISK_WEIGHTS['auto_renewal_high_escalation']
+
+# ASCII-only case folding, for text whose str.lower() changes length
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+@lru_cache(maxsize=64)
+def _lowered(contract_text: str) -> str:
+    """Lower-case a contract for pattern matching, keeping character offsets.
+    
+    Cached on the text: load_contract() hands out the same string object on
+    every call, so re-analyzing a contract reuses its lowered copy.
+    """
+    lowered = contract_text.lower()
+    if len(lowered) != len(contract_text):
+        lowered = contract_text.translate(_ASCII_LOWER)
+    return lowered
+
+
+def _find_liability_cap(lowered: str) -> Optional[Tuple[int, int]]:
+    """Return the span of the liability cap phrase, if any.
+    
+    Only the first "liability" of each sentence needs checking: a later one
+    in the same sentence sees a subset of the text, so it cannot succeed
+    where the first failed. That keeps the scan linear in the text length.
+    """
+    start = lowered.find('liability')
+    while start >= 0:
+        sentence_end = lowered.find('.', start)
+        if sentence_end < 0:
+            sentence_end = len(lowered)
+        not_exceed = _NOT_EXCEED_RE.search(lowered, start + 9, sentence_end)
+        if not_exceed:
+            cap = None
+            for cap in _LIABILITY_CAP_AMOUNT_RE.finditer(lowered, not_exceed.end(), sentence_end):
+                pass
+            if cap:
+                return cap.span(1)
+        start = lowered.find('liability', sentence_end)
+    return None
 
 
 def extract_contract_terms(contract_text: str) -> Dict[str, Any]:
     """Extract key terms from contract text using pattern matching."""
     terms = {}
     
-    # Extract parties
-    parties_match = re.search(r'PARTIES:.*?(?=\n\d\.|\nEFFECTIVE)', contract_text, re.DOTALL | re.IGNORECASE)
-    if parties_match:
-        parties_text = parties_match.group(0)
-        provider_match = re.search(r'(?:Provider|Licensor|Supplier|Consignor|Manufacturer|Developer):\s*([^"\n]+?)(?:\s*\("|\n)', parties_text)
-        customer_match = re.search(r'(?:Customer|Licensee|Distributor|Consignee|Buyer|Client):\s*([^"\n]+?)(?:\s*\("|\n)', parties_text)
+    # Spans in `lowered` line up with `contract_text`, so captured values
+    # are sliced from the original to keep their casing
+    lowered = _lowered(contract_text)
+    
+    # Extract parties: the block runs from "PARTIES:" to the first numbered
+    # section or the EFFECTIVE DATE line
+    parties_start = lowered.find('parties:')
+    parties_end = _PARTIES_END_RE.search(lowered, parties_start + 8) if parties_start >= 0 else None
+    if parties_end:
+        parties_text = contract_text[parties_start:parties_end.start()]
+        provider_match = _PROVIDER_RE.search(parties_text)
+        customer_match = _CUSTOMER_RE.search(parties_text)
         terms['parties'] = {
             'provider': provider_match.group(1).strip() if provider_match else 'Unknown',
             'customer': customer_match.group(1).strip() if customer_match else 'Unknown'
         }
     
     # Extract effective date
-    date_match = re.search(r'EFFECTIVE DATE:\s*(\w+ \d+, \d{4}|\d{4}-\d{2}-\d{2})', contract_text, re.IGNORECASE)
+    date_match = _EFFECTIVE_DATE_RE.search(lowered)
     if date_match:
-        terms['effective_date'] = date_match.group(1)
+        terms['effective_date'] = contract_text[date_match.start(1):date_match.end(1)]
     
     # Extract term/duration
-    term_match = re.search(r'(?:TERM|Initial term|INITIAL TERM):\s*(\d+)\s*months', contract_text, re.IGNORECASE)
+    term_match = _TERM_RE.search(lowered)
     if term_match:
         terms['term_months'] = int(term_match.group(1))
     elif 'Perpetual' in contract_text:
@@ -58,56 +155,57 @@ def extract_contract_terms(contract_text: str) -> Dict[str, Any]:
         terms['perpetual_license'] = True
     
     # Extract payment terms
-    payment_match = re.search(r'Net[\s-]?(\d+)\s*days?', contract_text, re.IGNORECASE)
+    payment_match = _NET_DAYS_RE.search(lowered)
     if payment_match:
         terms['payment_terms_days'] = int(payment_match.group(1))
     
     # Extract total value
-    value_patterns = [
-        r'Total[^:]*:\s*\$?([\d,]+(?:\.\d{2})?)',
-        r'Annual[^:]*:\s*\$?([\d,]+(?:\.\d{2})?)',
-        r'license fee:\s*\$?([\d,]+(?:\.\d{2})?)',
-        r'subscription fee:\s*\$?([\d,]+(?:\.\d{2})?)',
-    ]
-    for pattern in value_patterns:
-        match = re.search(pattern, contract_text, re.IGNORECASE)
+    for pattern in _VALUE_RES:
+        match = pattern.search(lowered)
         if match:
             terms['total_value'] = float(match.group(1).replace(',', ''))
             break
     
+    # Find which clauses are present
+    clauses = {
+        clause
+        for clause, (keywords, pattern) in _CLAUSE_PROBES.items()
+        if any(keyword in lowered for keyword in keywords) and pattern.search(lowered)
+    }
+    
     # Check for return rights
-    if re.search(r'right\s+(?:of|to)\s+return|unconditional\s+return', contract_text, re.IGNORECASE):
+    if 'return_rights' in clauses:
         terms['has_return_rights'] = True
-        return_days_match = re.search(r'(\d+)\s*(?:days?|DAYS)\s*(?:of|from)\s*delivery', contract_text, re.IGNORECASE)
+        return_days_match = _RETURN_DAYS_RE.search(lowered)
         if return_days_match:
             terms['return_period_days'] = int(return_days_match.group(1))
     
     # Check for auto-renewal
-    if re.search(r'auto(?:matic(?:ally)?)?[\s-]?renew', contract_text, re.IGNORECASE):
+    if 'auto_renewal' in clauses:
         terms['auto_renewal'] = True
         # Check for escalation
-        escalation_match = re.search(r'(?:increase|escalat\w*)\s*(?:by\s*)?(\d+(?:\.\d+)?)\s*(?:percent|%)', contract_text, re.IGNORECASE)
+        escalation_match = _ESCALATION_RE.search(lowered)
         if escalation_match:
             terms['annual_escalation_percent'] = float(escalation_match.group(1))
     
     # Check for consignment
-    if re.search(r'consignment|title\s+retention|retains?\s+(?:full\s+)?(?:legal\s+)?title', contract_text, re.IGNORECASE):
+    if 'consignment' in clauses:
         terms['consignment'] = True
     
     # Check for MFC/price protection
-    if re.search(r'most\s+favored\s+customer|MFC|price\s+protection|price\s+match', contract_text, re.IGNORECASE):
+    if 'mfc' in clauses:
         terms['mfc_clause'] = True
         terms['price_protection'] = True
     
     # Check for milestone payments
-    if re.search(r'milestone[\s-]?(?:based|payment)|contingent\s+(?:on|upon)', contract_text, re.IGNORECASE):
+    if 'milestone' in clauses:
         terms['milestone_based'] = True
     
     # Check for liability cap
-    liability_match = re.search(r'liability[^.]*(?:shall\s+)?not\s+exceed[^.]*(\d+\s+months?\s+(?:of\s+)?fees|fees\s+paid|license\s+fee)', contract_text, re.IGNORECASE)
-    if liability_match:
-        terms['liability_cap'] = liability_match.group(1)
-    elif re.search(r'unlimited\s+liability', contract_text, re.IGNORECASE):
+    liability_span = _find_liability_cap(lowered)
+    if liability_span:
+        terms['liability_cap'] = contract_text[liability_span[0]:liability_span[1]]
+    elif 'unlimited_liability' in clauses:
         terms['unlimited_liability'] = True
     
     return terms
@@ -130,10 +228,10 @@ def check_payment_terms(terms: Dict[str, Any]) -> Dict[str, Any]:
             'type': 'extended_payment_terms',
             'severity': 'medium' if excess_days <= 30 else 'high',
             'description': f'Net {payment_days} exceeds policy limit of {PAYMENT_TERMS_MAX_DAYS} days',
-            'asc_606_reference': ASC_606_RISK_FACTORS.get('extended_payment_terms', {}).get('reference')
+            'asc_606_reference': _ASC_REF.get('extended_payment_terms')
         })
         # Calculate risk contribution
-        result['risk_score_contribution'] = min(RISK_WEIGHTS['extended_payment_terms'] * (1 + excess_days / 60), 25)
+        result['risk_score_contribution'] = min(_W_EXTENDED_PAYMENT * (1 + excess_days / 60), 25)
     
     return result
 
@@ -157,11 +255,11 @@ def check_return_rights(terms: Dict[str, Any]) -> Dict[str, Any]:
             'type': 'extended_return_period',
             'severity': 'high' if return_days > 60 else 'medium',
             'description': f'{return_days}-day return period exceeds policy limit of {RETURN_PERIOD_MAX_DAYS} days',
-            'asc_606_reference': ASC_606_RISK_FACTORS.get('right_of_return', {}).get('reference')
+            'asc_606_reference': _ASC_REF.get('right_of_return')
         })
         # Higher risk for unconditional returns
         multiplier = 1.5 if return_days > 60 else 1.0
-        result['risk_score_contribution'] = RISK_WEIGHTS['right_of_return'] * multiplier
+        result['risk_score_contribution'] = _W_RIGHT_OF_RETURN * multiplier
     
     return result
 
@@ -181,9 +279,9 @@ def check_variable_consideration(terms: Dict[str, Any]) -> Dict[str, Any]:
             'type': 'mfc_clause',
             'severity': 'high',
             'description': 'Most Favored Customer clause creates open-ended variable consideration',
-            'asc_606_reference': ASC_606_RISK_FACTORS.get('price_protection', {}).get('reference')
+            'asc_606_reference': _ASC_REF.get('price_protection')
         })
-        result['risk_score_contribution'] += RISK_WEIGHTS['mfc_clause']
+        result['risk_score_contribution'] += _W_MFC
     
     # Check for milestone payments
     if terms.get('milestone_based'):
@@ -191,9 +289,9 @@ def check_variable_consideration(terms: Dict[str, Any]) -> Dict[str, Any]:
             'type': 'milestone_payments',
             'severity': 'medium',
             'description': 'Milestone-based payments may require constraint on variable consideration',
-            'asc_606_reference': ASC_606_RISK_FACTORS.get('milestone_payments', {}).get('reference')
+            'asc_606_reference': _ASC_REF.get('milestone_payments')
         })
-        result['risk_score_contribution'] += RISK_WEIGHTS['milestone_payments']
+        result['risk_score_contribution'] += _W_MILESTONE
     
     # Check for consignment
     if terms.get('consignment'):
@@ -202,9 +300,9 @@ def check_variable_consideration(terms: Dict[str, Any]) -> Dict[str, Any]:
             'type': 'consignment',
             'severity': 'high',
             'description': 'Consignment arrangement fails transfer of control criteria',
-            'asc_606_reference': ASC_606_RISK_FACTORS.get('consignment', {}).get('reference')
+            'asc_606_reference': _ASC_REF.get('consignment')
         })
-        result['risk_score_contribution'] += RISK_WEIGHTS['consignment']
+        result['risk_score_contribution'] += _W_CONSIGNMENT
     
     # Check for high escalation
     escalation = terms.get('annual_escalation_percent', 0)
@@ -215,7 +313,7 @@ def check_variable_consideration(terms: Dict[str, Any]) -> Dict[str, Any]:
             'description': f'{escalation}% annual escalation exceeds {AUTO_ESCALATION_MAX_PERCENT}% policy threshold',
             'asc_606_reference': None
         })
-        result['risk_score_contribution'] += RISK_WEIGHTS['auto_renewal_high_escalation']
+        result['risk_score_contribution'] += _W_HIGH_ESCALATION
     
     return result
 
@@ -236,17 +334,18 @@ def calculate_risk_score(
     return min(int(total_score), 100)
 
 
-def get_contract_summary(contract_id: str) -> Dict[str, Any]:
-    """Get summary info for a contract without full analysis."""
-    from .config import CONTRACT_DISPLAY_NAMES
+@lru_cache(maxsize=1)
+def _contract_summaries() -> Dict[str, Dict[str, Any]]:
+    """Build every demo contract summary once.
     
-    demo_path = Path(__file__).parent.parent / "data" / "demo_results.json"
-    with open(demo_path, "r") as f:
-        demo_results = json.load(f)
+    Built on first use rather than at import: agent imports this module, so
+    the demo results are not loadable yet while it is being imported.
+    """
+    from .config import CONTRACT_DISPLAY_NAMES
+    from .agent import load_demo_results
     
-    if contract_id in demo_results:
-        result = demo_results[contract_id]
-        return {
+    return {
+        contract_id: {
             'id': contract_id,
             'name': CONTRACT_DISPLAY_NAMES.get(contract_id, contract_id),
             'risk_score': result['resolver_verdict']['risk_score'],
@@ -254,5 +353,12 @@ def get_contract_summary(contract_id: str) -> Dict[str, Any]:
             'total_value': result.get('total_value', 0),
             'parties': result.get('parties', {})
         }
-    
-    return None
+        for contract_id, result in load_demo_results().items()
+    }
+
+
+def get_contract_summary(contract_id: str) -> Dict[str, Any]:
+    """Get summary info for a contract without full analysis."""
+    summary = _contract_summaries().get(contract_id)
+    # Copy so callers can't alter the shared summary
+    return dict(summary) if summary is not None else None